@@ -29,9 +29,9 @@ class MyEntity(ParametrizedEntity):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    # here we introduce a custom behavior when the state is "staging" and the value of the parameters `language` is equal to `fr`
+    # here we introduce a custom behavior when the stage is "staging" and the value of the parameters `language` is equal to `fr`
     def get_stage_versions(self, stage, parameters):
-        if "stage" == "staging" and parameters["language"] == "fr":
+        if stage == "staging" and parameters["language"] == "fr":
             return {"table_3": "1.1.0", "table_4": "2.0.0"}
         else:
             return self.stage_config[stage]
@@ -43,7 +43,7 @@ stage_config = {
     "staging": {"table_3": "1.0.0", "table_4": "1.0.0"},
     "data_warehouse": {"table_5": "1.1.0"},
 }
-entity1 = MyEntity("entity1", "1.0.0", stage_config)
+entity1 = MyEntity("entity1", "1.0.0", stage_config=stage_config)
 
 # Once the entities are defined, we can create pipelines.
 p1 = MyPipeline(
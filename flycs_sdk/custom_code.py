@@ -1,9 +1,77 @@
 """Module containing class used to inject custom Airflow operator into pipelines definitions."""
 
+import functools
 import inspect
+import re
+import sys
+from inspect import CO_VARARGS, CO_VARKEYWORDS
+from types import FunctionType
 from typing import Callable, List
 
-from requirements.requirement import Requirement
+
+# parameters that every operator builder function must accept, in this order
+_EXPECTED_BUILDER_PARAMS = ("dag", "env")
+
+# when True, every requirement is validated with the full requirements parser
+VALIDATE_STRICT = False
+
+# matches the common "name[extras] op version, op version" requirement lines.
+# Anything else (markers, urls, editable installs, ...) is handed to the full requirements parser.
+_REQUIREMENT_RE = re.compile(
+    r"[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?"
+    r"(?:\s*\[\s*[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?"
+    r"(?:\s*,\s*[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)*\s*\])?"
+    r"(?:\s*(?:(?:==|!=|>=|<=|>|<)\s*\d+(?:\.\d+)*|~=\s*\d+(?:\.\d+)+)"
+    r"(?:\s*,\s*(?:(?:==|!=|>=|<=|>|<)\s*\d+(?:\.\d+)*|~=\s*\d+(?:\.\d+)+))*)?"
+)
+
+
+def _builder_param_names(f: Callable) -> tuple:
+    """Return the names of the parameters accepted by an operator builder function.
+
+    Plain Python functions are read straight from their code object, which is much cheaper
+    than building an inspect.Signature. Any other callable (bound methods, partials,
+    decorated functions, ...) falls back to inspect.signature.
+
+    :param f: operator builder function
+    :type f: Callable
+    :return: tuple of parameter names
+    :rtype: tuple
+    """
+    if (
+        type(f) is FunctionType
+        and not hasattr(f, "__wrapped__")
+        and not hasattr(f, "__signature__")
+    ):
+        return _code_param_names(f.__code__)
+    return tuple(inspect.signature(f).parameters)
+
+
+@functools.lru_cache(maxsize=256)
+def _code_param_names(code) -> tuple:
+    """Return the names of the parameters of a code object.
+
+    The result is cached per code object so builders shared by several CustomCode objects
+    are only inspected once. The code object is used as key rather than the function,
+    it does not hold on to the globals and closure of the builder.
+
+    :param code: code object of a plain Python function
+    :type code: CodeType
+    :return: tuple of parameter names
+    :rtype: tuple
+    """
+    names = code.co_varnames
+    argcount = code.co_argcount
+    kwonlycount = code.co_kwonlyargcount
+    params = names[:argcount]
+    index = argcount + kwonlycount
+    if code.co_flags & CO_VARARGS:
+        params += (names[index],)
+        index += 1
+    params += names[argcount : argcount + kwonlycount]
+    if code.co_flags & CO_VARKEYWORDS:
+        params += (names[index],)
+    return params
 
 
 class WrongSignatureError(TypeError):
@@ -13,7 +81,13 @@ class WrongSignatureError(TypeError):
 
 
 class Dependency:
-    """Represent a pipeline operator dependency."""
+    """Represent a pipeline operator dependency.
+
+    Dependency objects are immutable so they can safely be used in sets and as dictionary keys.
+    """
+
+    # entity, stage and name are read-only properties over the key tuple
+    __slots__ = ("_key", "_hash")
 
     def __init__(self, entity: str, stage: str, name: str):
         """Create a Dependency object.
@@ -25,9 +99,49 @@ class Dependency:
         :param name: name of the dependant query
         :type name: str
         """
-        self.entity = entity
-        self.stage = stage
-        self.name = name
+        # entity, stage and query names are repeated across many Dependency objects, interning them
+        # shares a single string object, comparing two interned names then stops at the identity check
+        if type(entity) is str and type(stage) is str and type(name) is str:
+            key = (sys.intern(entity), sys.intern(stage), sys.intern(name))
+        else:
+            key = (entity, stage, name)
+        self._key = key
+        self._hash = hash(key)
+
+    @property
+    def entity(self) -> str:
+        """Name of the dependant entity."""
+        return self._key[0]
+
+    @property
+    def stage(self) -> str:
+        """Name of the dependant stage."""
+        return self._key[1]
+
+    @property
+    def name(self) -> str:
+        """Name of the dependant query."""
+        return self._key[2]
+
+    def __reduce__(self):
+        """Support copy and pickle by recreating the Dependency from its key."""
+        return (type(self), self._key)
+
+    def __repr__(self) -> str:
+        """Implement the __repr__ method."""
+        return f"Dependency(entity={self.entity!r}, stage={self.stage!r}, name={self.name!r})"
+
+    @property
+    def key(self) -> tuple:
+        """Return the (entity, stage, name) tuple identifying this dependency.
+
+        The tuple is built once, it can be used as a node key when building a dependency graph.
+        """
+        return self._key
+
+    def __iter__(self):
+        """Iterate over entity, stage and name, allowing ``entity, stage, name = dependency``."""
+        return iter(self._key)
 
     @classmethod
     def from_dict(cls, d):
@@ -40,6 +154,17 @@ class Dependency:
         """
         return cls(entity=d["ENTITY"], stage=d["STAGE"], name=d["NAME"])
 
+    @classmethod
+    def from_tuple(cls, t):
+        """Create a Dependency object form a tuple created with the to_tuple method.
+
+        :param t: source tuple
+        :type t: tuple
+        :return: Dependency
+        :rtype: Dependency
+        """
+        return cls(*t)
+
     def to_dict(self) -> dict:
         """
         Serialize the Dependency to a dictionary object.
@@ -52,22 +177,34 @@ class Dependency:
             "NAME": self.name,
         }
 
+    def to_tuple(self) -> tuple:
+        """
+        Serialize the Dependency to an (entity, stage, name) tuple.
+
+        This is cheaper than to_dict since the tuple is built once when the Dependency is created.
+
+        :return: the Dependency as a tuple.
+        """
+        return self._key
+
     def __eq__(self, other):
         """Implement the __eq__ method."""
-        return (
-            self.name == other.name
-            and self.entity == other.entity
-            and self.stage == other.stage
-        )
+        if self is other:
+            return True
+        if not isinstance(other, Dependency):
+            return NotImplemented
+        return self._key == other._key
 
     def __hash__(self) -> int:
-        """Implement the __eq__ method."""
-        return hash(f"{self.name}{self.entity}{self.stage}")
+        """Implement the __hash__ method."""
+        return self._hash
 
 
 class CustomCode:
     """Class representing a custom airflow operator to inject into an Airflow DAG."""
 
+    __slots__ = ("name", "version", "operator_builder", "dependencies", "requirements")
+
     def __init__(
         self,
         name: str,
@@ -101,8 +238,7 @@ class CustomCode:
         self._validate_requirements()
 
     def _ensure_builder_signature(self, f: Callable):
-        signature = inspect.Signature.from_callable(f)
-        if ["dag", "env"] != list(signature.parameters.keys()):
+        if _builder_param_names(f) != _EXPECTED_BUILDER_PARAMS:
             raise WrongSignatureError(
                 f"the builder function of the custom code {self.name}_{self.version} does not accept the mandatory ('dag', 'env', 'user') arguments"
             )
@@ -113,5 +249,21 @@ class CustomCode:
 
         :raises ValueError: if format is not valid
         """
-        for line in self.requirements:
+        if not self.requirements:
+            return
+
+        requirements = self.requirements
+        if not VALIDATE_STRICT:
+            requirements = [
+                line
+                for line in requirements
+                if _REQUIREMENT_RE.fullmatch(line.strip()) is None
+            ]
+            if not requirements:
+                return
+
+        # imported lazily, the requirements package is only needed when requirements are defined
+        from requirements.requirement import Requirement
+
+        for line in requirements:
             Requirement.parse(line)
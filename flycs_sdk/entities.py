@@ -1,6 +1,8 @@
 """Module containing entity classes."""
 
-from typing import Dict, List, Optional, Union
+import functools
+import sys
+from typing import Dict, List, Optional, Tuple, Union
 from .custom_code import CustomCode
 from enum import Enum
 from .transformations import Transformation
@@ -9,6 +11,11 @@ from .functions import Function
 from .procedures import StoredProcedure
 
 
+def _intern(value):
+    """Intern value if it is a string."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class ConflictingNameError(ValueError):
     """Raised when trying to insert a Transformation or View into an entities \
     that already contains a Transformation or View with the same name."""
@@ -24,9 +31,56 @@ class EntityKind(Enum):
     DATA_VAULT = "data_vault"
 
 
+# maps the serialized kind (and the members themselves) to the EntityKind member
+_KIND_LOOKUP = {None: None}
+for _kind in EntityKind:
+    _KIND_LOOKUP[_kind.value] = _kind
+    _KIND_LOOKUP[_kind] = _kind
+del _kind
+
+
+def _parse_kind(value) -> Optional[EntityKind]:
+    """Return the EntityKind matching a serialized kind.
+
+    :param value: the serialized kind, can be None
+    :return: the matching EntityKind or None
+    :rtype: Optional[EntityKind]
+    :raises ValueError: if the value is not a valid EntityKind
+    """
+    try:
+        return _KIND_LOOKUP[value]
+    except (KeyError, TypeError):
+        # unknown or unhashable values, EntityKind raises the ValueError
+        return EntityKind(value)
+
+
+def _iter_stage_config(stage_config: Union[list, dict]):
+    """Iterate over the stages of a serialized stage config.
+
+    Both the list of stages and the flat dictionary produced by to_dict are supported.
+
+    :param stage_config: the serialized stage config
+    :type stage_config: Union[list, dict]
+    :return: an iterable of (stage name, versions) tuples
+    """
+    if isinstance(stage_config, dict):
+        return stage_config.items()
+    return ((stage["name"], stage["versions"]) for stage in stage_config)
+
+
 class Entity:
     """Class that serves as a version configuration for a logical subset of a Pipeline."""
 
+    __slots__ = (
+        "name",
+        "version",
+        "kind",
+        "stage_config",
+        "transformations",
+        "custom_operators",
+        "location",
+    )
+
     def __init__(
         self,
         name: str,
@@ -51,8 +105,8 @@ class Entity:
         :param location: The location where to create the associated dataset. This field is optional and only required when you want to
                   manually overwrite the default dataset location configure in the environmen
         """
-        self.name = name
-        self.version = version
+        self.name = _intern(name)
+        self.version = _intern(version)
         self.kind = kind
         self.stage_config = stage_config or {}
         self.transformations = {}
@@ -69,11 +123,14 @@ class Entity:
         :return: Entity
         :rtype: Entity
         """
-        stage_config = {stage["name"]: stage["versions"] for stage in d["stage_config"]}
+        stage_config = {
+            _intern(stage): versions
+            for stage, versions in _iter_stage_config(d["stage_config"])
+        }
         return cls(
             name=d["name"],
             version=d["version"],
-            kind=EntityKind(d["kind"]) if d.get("kind") is not None else None,
+            kind=_parse_kind(d.get("kind")),
             stage_config=stage_config,
             location=d.get("location"),
         )
@@ -81,7 +138,7 @@ class Entity:
     @property
     def stages(self):
         """Return a list of all the stages defined in this entity."""
-        return list(self.stage_config.keys())
+        return list(self.stage_config)
 
     def get_stage_versions(self, stage: str) -> Dict[str, str]:
         """
@@ -95,21 +152,13 @@ class Entity:
     def _insert_into_stage_config(
         self, stage: str, obj: Union[Transformation, View, Function, StoredProcedure]
     ):
-        if stage not in self.stage_config:
-            self.stage_config[stage] = {}
-        if obj.name in self.stage_config[stage]:
+        versions = self.stage_config.setdefault(stage, {})
+        if obj.name in versions:
             raise ConflictingNameError(
-                "an object with name {obj.name} already exists in stage {stage}"
+                f"an object with name {obj.name} already exists in stage {stage}"
             )
-        self.stage_config[stage].update({obj.name: obj.version})
-
-        if stage not in self.transformations:
-            self.transformations[stage] = {}
-        if obj.name in self.transformations[stage]:
-            raise ConflictingNameError(
-                "an object with name {obj.name} already exists in stage {stage}"
-            )
-        self.transformations[stage].update({obj.name: obj})
+        versions[obj.name] = obj.version
+        self.transformations.setdefault(stage, {})[obj.name] = obj
 
     def add_transformation(self, stage: str, transformation: Transformation):
         """Insert a Transformation into the stage_config of the entity.
@@ -141,40 +190,117 @@ class Entity:
         """
         self._insert_into_stage_config(stage, routine)
 
-    def to_dict(self) -> Dict:
+    def to_dict(self, flat: bool = False) -> Dict:
         """
         Serialize the entity to a dictionary object.
 
+        :param flat: if True, serialize the stage config as a dictionary with the name of the stage as key
+                     and the versions as value instead of a list of stages, defaults to False
+        :type flat: bool
         :return: the entity as a dictionary object.
         """
+        if flat:
+            return {
+                "name": self.name,
+                "version": self.version,
+                "kind": self.kind.value if self.kind is not None else None,
+                "stage_config": dict(self.stage_config),
+                "location": self.location,
+            }
         return {
             "name": self.name,
             "version": self.version,
             "kind": self.kind.value if self.kind is not None else None,
             "stage_config": [
-                {"name": stage, "versions": self.get_stage_versions(stage)}
-                for stage in self.stage_config.keys()
-            ]
-            if self.stage_config is not None
-            else [],
+                {"name": stage, "versions": versions}
+                for stage, versions in self.stage_config.items()
+            ],
             "location": self.location,
         }
 
     def __eq__(self, other):
         """Implement the __eq__ method."""
+        if self is other:
+            return True
+        if not isinstance(other, (Entity, ParametrizedEntity)):
+            return NotImplemented
         return (
-            self.name == other.name
-            and self.version == other.version
-            and self.stage_config == other.stage_config
-            and self.kind == other.kind
-            and self.location == other.location
-        )
+            self.name,
+            self.version,
+            self.stage_config,
+            self.kind,
+            self.location,
+        ) == (other.name, other.version, other.stage_config, other.kind, other.location)
+
+    def __hash__(self):
+        """Implement the __hash__ method."""
+        return hash((self.name, self.version))
+
+
+# the fixed stages of the base layer entities, these string literals are interned by the compiler
+# and are shared by both base layer classes
+_BASE_LAYER_STAGES = ("datalake", "preamble", "staging", "data_warehouse", "data_mart")
+
+
+def _versions_or_empty(versions: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Return versions, or a new empty dictionary if versions is None."""
+    return versions if versions is not None else {}
+
+
+def _stage_versions_property(stage: str) -> property:
+    """Create a property giving access to the versions of a fixed stage of a base layer entity.
+
+    The versions are stored in the stage_config of the entity, so the property and the stage_config
+    can never get out of sync.
+
+    :param stage: name of the stage
+    :type stage: str
+    :return: property reading and writing stage_config[stage]
+    :rtype: property
+    """
+
+    def getter(self) -> Dict[str, str]:
+        return self.stage_config[stage]
+
+    def setter(self, versions: Optional[Dict[str, str]]):
+        self.stage_config[stage] = _versions_or_empty(versions)
+
+    return property(
+        getter, setter, doc=f"Versions of the queries in the {stage} stage."
+    )
+
+
+def _load_base_layer_stage_config(
+    entity: Union["BaseLayerEntity", "ParametrizedBaseLayerEntity"], d: dict
+):
+    """Load the versions of the fixed stages from a dictionary created with the to_dict method.
+
+    Stages that are not one of the fixed stages of the entity are ignored.
+
+    :param entity: the entity to load the versions into
+    :type entity: BaseLayerEntity or ParametrizedBaseLayerEntity
+    :param d: source dictionary
+    :type d: dict
+    """
+    stage_config = entity.stage_config
+    for stage, versions in _iter_stage_config(d.get("stage_config") or ()):
+        if stage in stage_config:
+            stage_config[stage] = _versions_or_empty(versions)
 
 
 class BaseLayerEntity(Entity):
     """Class that serves as a version configuration for a logical subset of a Pipeline with fixed layers."""
 
-    _stages = ["datalake", "preamble", "staging", "data_warehouse", "data_mart"]
+    # the versions of each stage are stored in stage_config, no extra attribute is needed
+    __slots__ = ()
+
+    _stages = _BASE_LAYER_STAGES
+
+    datalake_versions = _stage_versions_property("datalake")
+    preamble_versions = _stage_versions_property("preamble")
+    staging_versions = _stage_versions_property("staging")
+    data_warehouse_versions = _stage_versions_property("data_warehouse")
+    data_mart_versions = _stage_versions_property("data_mart")
 
     def __init__(
         self,
@@ -204,12 +330,13 @@ class BaseLayerEntity(Entity):
         :param data_mart_versions: the versions of the queries for the data mart stage
         """
         super().__init__(name, version, kind)
-        self.datalake_versions = datalake_versions
-        self.preamble_versions = preamble_versions
-        self.staging_versions = staging_versions
-        self.data_warehouse_versions = data_warehouse_versions
-        self.data_mart_versions = data_mart_versions
-        self.stage_config = self.get_stage_config()
+        self.stage_config = {
+            "datalake": _versions_or_empty(datalake_versions),
+            "preamble": _versions_or_empty(preamble_versions),
+            "staging": _versions_or_empty(staging_versions),
+            "data_warehouse": _versions_or_empty(data_warehouse_versions),
+            "data_mart": _versions_or_empty(data_mart_versions),
+        }
 
     @classmethod
     def from_dict(cls, d: dict):
@@ -223,112 +350,41 @@ class BaseLayerEntity(Entity):
         entity = cls(
             name=d["name"],
             version=d["version"],
-            kind=EntityKind(d["kind"]) if d.get("kind") is not None else None,
+            kind=_parse_kind(d.get("kind")),
         )
-        for stage in d.get("stage_config", {}):
-            if stage["name"] == "datalake":
-                entity.datalake_versions = stage["versions"]
-            elif stage["name"] == "preamble":
-                entity.preamble_versions = stage["versions"]
-            if stage["name"] == "staging":
-                entity.staging_versions = stage["versions"]
-            if stage["name"] == "data_warehouse":
-                entity.data_warehouse_versions = stage["versions"]
-            if stage["name"] == "data_mart":
-                entity.data_mart_versions = stage["versions"]
-        entity.stage_config = entity.get_stage_config()
+        _load_base_layer_stage_config(entity, d)
         return entity
 
     @property
     def stages(self):
         """Return a list of all the stages defined in this entity."""
-        return self.stages.copy()
+        return list(self._stages)
 
     def get_stage_config(self):
         """
         Get the stage config for a base layer entity based on the fixed stages in the BaseLayerEntity.
 
-        :return: a dictionary in the form of a stage config
-        """
-        return {stage: self.get_stage_versions(stage) for stage in self._stages}
-
-    def get_stage_versions(self, stage: str) -> Dict[str, str]:
-        """
-        Get the versions of the queries in the given stage.
-
-        :param stage: the stage to get the versions for
-        :return: the versions of the queries in the given stage
-        """
-        if stage == "datalake":
-            return self.get_datalake_versions()
-        elif stage == "preamble":
-            return self.get_preamble_versions()
-        if stage == "staging":
-            return self.get_staging_versions()
-        if stage == "data_warehouse":
-            return self.get_data_warehouse_versions()
-        if stage == "data_mart":
-            return self.get_data_mart_versions()
-
-    def get_datalake_versions(self) -> Dict[str, str]:
-        """
-        Get the versions of the queries in the datalake stage.
-
-        :return: the versions of the queries in the datalake stage
-        """
-        if self.datalake_versions is None:
-            return {}
-        else:
-            return self.datalake_versions
-
-    def get_preamble_versions(self) -> Dict[str, str]:
-        """
-        Get the versions of the queries in the preamble stage.
-
-        :return: the versions of the queries in the preamble stage
-        """
-        if self.preamble_versions is None:
-            return {}
-        else:
-            return self.preamble_versions
-
-    def get_staging_versions(self) -> Dict[str, str]:
-        """
-        Get the versions of the queries in the staging stage.
-
-        :return: the versions of the queries in the staging stage
-        """
-        if self.staging_versions is None:
-            return {}
-        else:
-            return self.staging_versions
-
-    def get_data_warehouse_versions(self) -> Dict[str, str]:
-        """
-        Get the versions of the queries in the data warehouse stage.
-
-        :return: the versions of the queries in the data warehouse stage
-        """
-        if self.data_warehouse_versions is None:
-            return {}
-        else:
-            return self.data_warehouse_versions
+        The stage config is built once in __init__ and kept up to date by the version properties,
+        so it is returned directly.
 
-    def get_data_mart_versions(self) -> Dict[str, str]:
-        """
-        Get the versions of the queries in the data mart stage.
-
-        :return: the versions of the queries in the data mart stage
+        :return: a dictionary in the form of a stage config
         """
-        if self.data_mart_versions is None:
-            return {}
-        else:
-            return self.data_mart_versions
+        return self.stage_config
 
 
 class ParametrizedEntity:
     """Class that serves as a version configuration for a logical subset of a ParametrizedPipeline."""
 
+    __slots__ = (
+        "name",
+        "version",
+        "kind",
+        "stage_config",
+        "transformations",
+        "custom_operators",
+        "location",
+    )
+
     def __init__(
         self,
         name: str,
@@ -356,8 +412,8 @@ class ParametrizedEntity:
         :param location: The location where to create the associated dataset. This field is optional and only required when you want to
                   manually overwrite the default dataset location configure in the environmen
         """
-        self.name = name
-        self.version = version
+        self.name = _intern(name)
+        self.version = _intern(version)
         self.kind = kind
         self.stage_config = stage_config or {}
         self.transformations = {}
@@ -373,11 +429,14 @@ class ParametrizedEntity:
         :return: ParametrizedEntity
         :rtype: ParametrizedEntity
         """
-        stage_config = {stage["name"]: stage["versions"] for stage in d["stage_config"]}
+        stage_config = {
+            _intern(stage): versions
+            for stage, versions in _iter_stage_config(d["stage_config"])
+        }
         return cls(
             name=d["name"],
             version=d["version"],
-            kind=EntityKind(d["kind"]) if d.get("kind") is not None else None,
+            kind=_parse_kind(d.get("kind")),
             stage_config=stage_config,
             location=d.get("location"),
         )
@@ -385,7 +444,7 @@ class ParametrizedEntity:
     @property
     def stages(self):
         """Return a list of all the stages defined in this entity."""
-        return list(self.stage_config.keys())
+        return list(self.stage_config)
 
     def get_stage_versions(
         self, stage: str, parameters: Dict[str, str] = None
@@ -399,39 +458,72 @@ class ParametrizedEntity:
         """
         return self.stage_config[stage]
 
-    def to_dict(self, parameters: Dict[str, str] = None) -> Dict:
+    def to_dict(self, parameters: Dict[str, str] = None, flat: bool = False) -> Dict:
         """
         Serialize the entity to a dictionary object.
 
         :param parameters: the pipeline parameters
+        :param flat: if True, serialize the stage config as a dictionary with the name of the stage as key
+                     and the versions as value instead of a list of stages, defaults to False
+        :type flat: bool
         :return: the entity as a dictionary object.
         """
+        if flat:
+            return {
+                "name": _parametrized_name(self.name, parameters),
+                "version": self.version,
+                "kind": self.kind.value if self.kind is not None else None,
+                "stage_config": {
+                    stage: self.get_stage_versions(stage, parameters)
+                    for stage in self.stage_config
+                },
+                "location": self.location,
+            }
+        # bind the method once, it is called for every stage
+        get_stage_versions = self.get_stage_versions
         return {
             "name": _parametrized_name(self.name, parameters),
             "version": self.version,
             "kind": self.kind.value if self.kind is not None else None,
             "stage_config": [
-                {"name": stage, "versions": self.get_stage_versions(stage, parameters)}
-                for stage in self.stage_config.keys()
+                {"name": stage, "versions": get_stage_versions(stage, parameters)}
+                for stage in self.stage_config
             ],
             "location": self.location,
         }
 
     def __eq__(self, other):
         """Implement the __eq__ method."""
+        if self is other:
+            return True
+        if not isinstance(other, (Entity, ParametrizedEntity)):
+            return NotImplemented
         return (
-            self.name == other.name
-            and self.version == other.version
-            and self.stage_config == other.stage_config
-            and self.kind == other.kind
-            and self.location == other.location
-        )
+            self.name,
+            self.version,
+            self.stage_config,
+            self.kind,
+            self.location,
+        ) == (other.name, other.version, other.stage_config, other.kind, other.location)
+
+    def __hash__(self):
+        """Implement the __hash__ method."""
+        return hash((self.name, self.version))
 
 
 class ParametrizedBaseLayerEntity(ParametrizedEntity):
     """Class that serves as a version configuration for a logical subset of a ParametrizedPipeline with fixed layers."""
 
-    _stages = ["datalake", "preamble", "staging", "data_warehouse", "data_mart"]
+    # the versions of each stage are stored in stage_config, no extra attribute is needed
+    __slots__ = ()
+
+    _stages = _BASE_LAYER_STAGES
+
+    datalake_versions = _stage_versions_property("datalake")
+    preamble_versions = _stage_versions_property("preamble")
+    staging_versions = _stage_versions_property("staging")
+    data_warehouse_versions = _stage_versions_property("data_warehouse")
+    data_mart_versions = _stage_versions_property("data_mart")
 
     def __init__(
         self,
@@ -461,12 +553,13 @@ class ParametrizedBaseLayerEntity(ParametrizedEntity):
         :param data_mart_versions: the versions of the queries for the data mart stage
         """
         super().__init__(name, version, kind)
-        self.datalake_versions = datalake_versions
-        self.preamble_versions = preamble_versions
-        self.staging_versions = staging_versions
-        self.data_warehouse_versions = data_warehouse_versions
-        self.data_mart_versions = data_mart_versions
-        self.stage_config = self.get_stage_config()
+        self.stage_config = {
+            "datalake": _versions_or_empty(datalake_versions),
+            "preamble": _versions_or_empty(preamble_versions),
+            "staging": _versions_or_empty(staging_versions),
+            "data_warehouse": _versions_or_empty(data_warehouse_versions),
+            "data_mart": _versions_or_empty(data_mart_versions),
+        }
 
     @classmethod
     def from_dict(cls, d: dict):
@@ -480,118 +573,27 @@ class ParametrizedBaseLayerEntity(ParametrizedEntity):
         entity = cls(
             name=d["name"],
             version=d["version"],
-            kind=EntityKind(d["kind"]) if d.get("kind") is not None else None,
-            datalake_versions=d["stage_config"],
-            preamble_versions=d["preamble_versions"],
-            staging_versions=d["staging_versions"],
-            data_warehouse_versions=d["data_warehouse_versions"],
-            data_mart_versions=d["data_mart_versions"],
+            kind=_parse_kind(d.get("kind")),
         )
-        entity.stage_config = entity.get_stage_config()
+        _load_base_layer_stage_config(entity, d)
         return entity
 
     @property
     def stages(self):
         """Return a list of all the stages defined in this entity."""
-        return self.stages.copy()
+        return list(self._stages)
 
     def get_stage_config(self, parameters: Dict[str, str] = None):
         """
         Get the stage config for a base layer entity based on the fixed stages in the BaseLayerEntity.
 
+        The stage config is built once in __init__ and kept up to date by the version properties,
+        so it is returned directly.
+
         :param parameters: the pipeline parameters to get the config for
         :return: a dictionary in the form of a stage config
         """
-        return {stage: self.get_stage_versions(stage) for stage in self._stages}
-
-    def get_stage_versions(
-        self, stage: str, parameters: Dict[str, str] = None
-    ) -> Dict[str, str]:
-        """
-        Get the versions of the queries in the given stage.
-
-        :param stage: the stage to get the versions for
-        :param parameters: the pipeline parameters to get the versions for
-        :return: the versions of the queries in the given stage
-        """
-        if stage == "datalake":
-            return self.get_datalake_versions(parameters)
-        elif stage == "preamble":
-            return self.get_preamble_versions(parameters)
-        if stage == "staging":
-            return self.get_staging_versions(parameters)
-        if stage == "data_warehouse":
-            return self.get_data_warehouse_versions(parameters)
-        if stage == "data_mart":
-            return self.get_data_mart_versions(parameters)
-
-    def get_datalake_versions(
-        self, parameters: Dict[str, str] = None
-    ) -> Dict[str, str]:
-        """
-        Get the versions of the queries in the datalake stage.
-
-        :param parameters: the pipeline parameters to get the versions for
-        :return: the versions of the queries in the datalake stage
-        """
-        if self.datalake_versions is None:
-            return {}
-        else:
-            return self.datalake_versions
-
-    def get_preamble_versions(
-        self, parameters: Dict[str, str] = None
-    ) -> Dict[str, str]:
-        """
-        Get the versions of the queries in the preamble stage.
-
-        :param parameters: the pipeline parameters to get the versions for
-        :return: the versions of the queries in the preamble stage
-        """
-        if self.preamble_versions is None:
-            return {}
-        else:
-            return self.preamble_versions
-
-    def get_staging_versions(self, parameters: Dict[str, str] = None) -> Dict[str, str]:
-        """
-        Get the versions of the queries in the staging stage.
-
-        :param parameters: the pipeline parameters to get the versions for
-        :return: the versions of the queries in the staging stage
-        """
-        if self.staging_versions is None:
-            return {}
-        else:
-            return self.staging_versions
-
-    def get_data_warehouse_versions(
-        self, parameters: Dict[str, str] = None
-    ) -> Dict[str, str]:
-        """
-        Get the versions of the queries in the data warehouse stage.
-
-        :param parameters: the pipeline parameters to get the versions for
-        :return: the versions of the queries in the data warehouse stage
-        """
-        if self.data_warehouse_versions is None:
-            return {}
-        else:
-            return self.data_warehouse_versions
-
-    def get_data_mart_versions(
-        self, parameters: Dict[str, str] = None
-    ) -> Dict[str, str]:
-        """
-        Get the versions of the queries in the data mart stage.
-
-        :param parameters: the pipeline parameters to get the versions for
-        :return: the versions of the queries in the data mart stage
-        """
-        if self.data_mart_versions is None:
-            return {}
-        else:
-            return self.data_mart_versions
+        return self.stage_config
 
 
 def _parametrized_name(name: str, parameters: Dict[str, str]) -> str:
@@ -607,12 +609,27 @@ def _parametrized_name(name: str, parameters: Dict[str, str]) -> str:
     if not parameters:
         return name
 
-    # must follow https://cloud.google.com/bigquery/docs/datasets#dataset-naming
-    parts = [name, *parameters.values()]
-    new_name = "_".join(parts)
+    return _join_parametrized_name(name, tuple(parameters.values()))
+
 
-    if len(new_name) > 1024:
+@functools.lru_cache(maxsize=4096)
+def _join_parametrized_name(name: str, values: Tuple[str, ...]) -> str:
+    """Join a name and parameters values into a parametrized name.
+
+    The result is cached since the same name and parameters are rendered for every pipeline
+    sharing an entity.
+
+    :param name: original name
+    :type name: str
+    :param values: values of the parameters
+    :type values: tuple
+    :return: parametrized name
+    :rtype: str
+    """
+    # must follow https://cloud.google.com/bigquery/docs/datasets#dataset-naming
+    # the length is known before joining: one separator per value
+    if len(name) + len(values) + sum(map(len, values)) > 1024:
         raise ValueError(
-            f"the size of the name ({new_name}) is to big, maximum size is 1024 characters"
+            f"the size of the name ({name}_{'_'.join(values)}) is to big, maximum size is 1024 characters"
         )
-    return new_name
+    return f"{name}_{'_'.join(values)}"
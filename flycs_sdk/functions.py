@@ -1,6 +1,6 @@
 """Module containing Function classes."""
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from flycs_sdk.custom_code import Dependency
 from flycs_sdk.query_base import QueryBase
@@ -9,6 +9,8 @@ from flycs_sdk.query_base import QueryBase
 class Argument:
     """Class representing a function Argument."""
 
+    __slots__ = ("name", "type")
+
     def __init__(self, name: str, type: str):
         """Create an Argument object.
 
@@ -41,7 +43,13 @@ class Argument:
 
     def __eq__(self, o) -> bool:
         """Implement __eq__ method."""
-        return self.name == o.name and self.type == o.type
+        if not isinstance(o, Argument):
+            return NotImplemented
+        return (self.name, self.type) == (o.name, o.type)
+
+    def __hash__(self):
+        """Implement __hash__ method."""
+        return hash((self.name, self.type))
 
 
 class Function(QueryBase):
@@ -49,6 +57,16 @@ class Function(QueryBase):
 
     kind = "function"
 
+    __slots__ = (
+        "destination_table",
+        "dependencies",
+        "parsing_dependencies",
+        "argument_list",
+        "description",
+        "return_type",
+        "language",
+    )
+
     def __init__(
         self,
         name: str,
@@ -109,17 +127,17 @@ class Function(QueryBase):
             description=d.get("DESCRIPTION"),
             static=d.get("STATIC", True),
             destination_data_mart=d.get("DESTINATION_DATA_MART"),
-            argument_list=[Argument.from_dict(a) for a in d.get("ARGUMENT_LIST") or []],
+            argument_list=list(map(Argument.from_dict, d.get("ARGUMENT_LIST") or ())),
             return_type=d.get("RETURN_TYPE"),
             language=d.get("LANGUAGE", "sql"),
         )
         function.destination_table = d.get("DESTINATION_TABLE")
-        function.dependencies = [
-            Dependency.from_dict(x) for x in d.get("DEPENDS_ON") or []
-        ]
-        function.parsing_dependencies = [
-            Dependency.from_dict(x) for x in d.get("PARSING_DEPENDS_ON") or []
-        ]
+        function.dependencies = list(
+            map(Dependency.from_dict, d.get("DEPENDS_ON") or ())
+        )
+        function.parsing_dependencies = list(
+            map(Dependency.from_dict, d.get("PARSING_DEPENDS_ON") or ())
+        )
         return function
 
     def to_dict(self) -> dict:
@@ -145,20 +163,41 @@ class Function(QueryBase):
             "LANGUAGE": self.language,
         }
 
-    def __eq__(self, o) -> bool:
-        """Implement __eq__ method."""
+    def arguments_to_tuples(self) -> List[Tuple[str, str]]:
+        """
+        Serialize the arguments of the Function to a list of (name, type) tuples.
+
+        This is a lighter alternative to the ARGUMENT_LIST of to_dict for consumers that do not need dictionaries.
+
+        :return: the arguments as (name, type) tuples
+        :rtype: List[Tuple[str, str]]
+        """
+        return [(a.name, a.type) for a in self.argument_list]
+
+    def _key(self) -> tuple:
+        """Return the fields that identify the Function, used for comparison."""
         return (
-            self.name == o.name
-            and self.query == o.query
-            and self.version == o.version
-            and self.description == o.description
-            and self.destination_table == o.destination_table
-            and self.kind == o.kind
-            and self.static == o.static
-            and self.destination_data_mart == o.destination_data_mart
-            and self.dependencies == o.dependencies
-            and self.parsing_dependencies == o.parsing_dependencies
-            and self.argument_list == o.argument_list
-            and self.return_type == o.return_type
-            and self.language == o.language
+            self.name,
+            self.query,
+            self.version,
+            self.description,
+            self.destination_table,
+            self.kind,
+            self.static,
+            self.destination_data_mart,
+            self.dependencies,
+            self.parsing_dependencies,
+            self.argument_list,
+            self.return_type,
+            self.language,
         )
+
+    def __eq__(self, o) -> bool:
+        """Implement __eq__ method."""
+        if not isinstance(o, Function):
+            return NotImplemented
+        return self._key() == o._key()
+
+    def __hash__(self):
+        """Implement __hash__ method."""
+        return hash((self.name, self.version))
@@ -1,11 +1,11 @@
 """Module containing pipeline classes."""
 
+import functools
 import itertools
-from datetime import datetime, timezone
+import re
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Dict, List, Union, Tuple, Optional
-
-from semver import VersionInfo
+from typing import Dict, Iterator, List, Union, Tuple, Optional
 
 from .entities import (
     BaseLayerEntity,
@@ -29,6 +29,17 @@ class PipelineKind(Enum):
 class Pipeline:
     """Class representing a pipeline configuration."""
 
+    __slots__ = (
+        "name",
+        "version",
+        "schedule",
+        "kind",
+        "start_time",
+        "trigger",
+        "entities",
+        "params",
+    )
+
     def __init__(
         self,
         name: str,
@@ -139,20 +150,40 @@ class Pipeline:
 
     def __eq__(self, other):
         """Implement __eq__ method."""
+        if self is other:
+            return True
+        if not isinstance(other, Pipeline):
+            return NotImplemented
+        # the entities are compared last, they are the most expensive to compare
         return (
             self.name == other.name
             and self.version == other.version
             and self.schedule == other.schedule
-            and self.kind.value == other.kind.value
+            and self.kind is other.kind
             and self.start_time == other.start_time
             and self.trigger == other.trigger
             and self.entities == other.entities
         )
 
+    def __hash__(self):
+        """Implement __hash__ method."""
+        return hash((self.name, self.version))
+
 
 class ParametrizedPipeline:
     """Class ParametrizedPipeline represents a dynamic pipeline configuration."""
 
+    __slots__ = (
+        "name",
+        "version",
+        "_schedule",
+        "kind",
+        "_start_time",
+        "trigger",
+        "entities",
+        "parameters",
+    )
+
     def __init__(
         self,
         name: str,
@@ -236,24 +267,36 @@ class ParametrizedPipeline:
         :return: List of Pipeline object
         :rtype: List[Pipeline]
         """
-        parameters = [
-            dict(zip(self.parameters.keys(), x))
-            for x in itertools.product(*self.parameters.values())
-        ]
-
+        # read the properties once, sub-classes can compute them
+        schedule = self.schedule
+        start_time = self.start_time
         return [
             Pipeline(
                 name=_parametrized_name(self.name, p),
                 version=self.version,
-                schedule=self.schedule,
+                schedule=schedule,
                 entities=self.entities,
                 kind=self.kind,
-                start_time=self.start_time,
+                start_time=start_time,
                 params=p,
             )
-            for p in parameters
+            for p in self._parameters_combinations()
         ]
 
+    def _parameters_combinations(self) -> Iterator[Dict[str, str]]:
+        """Iterate over all the possible combinations of the parameters.
+
+        For parameters like {"language": ["nl", "fr"], "country": ["be", "en"]} it yields:
+        {"language": "nl", "country": "be"}, {"language": "nl", "country": "en"},
+        {"language": "fr", "country": "be"} and {"language": "fr", "country": "en"}
+
+        :return: an iterator over the combinations of the parameters
+        :rtype: Iterator[Dict[str, str]]
+        """
+        keys = tuple(self.parameters)
+        for combination in itertools.product(*self.parameters.values()):
+            yield dict(zip(keys, combination))
+
     def to_dict(self) -> List[Dict]:
         """
         Serialize the pipeline to a list of dictionary object.
@@ -263,50 +306,59 @@ class ParametrizedPipeline:
         :return: the list of parametrized pipeline.
         :rtype: List
         """
-        # creates a list of all possible combination of parameter
-        # for a self.parameters like: {"language": ["nl", "fr"], "country": ["be", "en"]}
-        # it creates a list like:
-        # [
-        #     {"language": "nl", "country": "be"},
-        #     {"language": "nl", "country": "en"},
-        #     {"language": "fr", "country": "be"},
-        #     {"language": "fr", "country": "en"},
-        # ]
-        parameters = [
-            dict(zip(self.parameters.keys(), x))
-            for x in itertools.product(*self.parameters.values())
-        ]
-
         schedule = self.schedule
         if isinstance(self.schedule, ParametrizedPipeline):
             schedule = format_target_pipeline(self.schedule)
 
+        # these fields do not depend on the parameters, compute them once for all the combinations
+        version = self.version
+        start_time = _format_datetime(self.start_time) if self.start_time else None
+        trigger = self.trigger.to_dict() if self.trigger else None
+        kind = self.kind.value
+        name = self.name
+        entities = self.entities
+        parametrized_name = _parametrized_name
+
         return [
             {
-                "name": _parametrized_name(self.name, p),
-                "version": self.version,
+                "name": parametrized_name(name, p),
+                "version": version,
                 "schedule": schedule,
-                "start_time": _format_datetime(self.start_time)
-                if self.start_time
-                else None,
-                "trigger": self.trigger.to_dict() if self.trigger else None,
-                "kind": self.kind.value,
+                "start_time": start_time,
+                "trigger": trigger,
+                "kind": kind,
                 "params": p,
-                "entities": [e.to_dict(parameters=p) for e in self.entities],
+                "entities": [e.to_dict(parameters=p) for e in entities],
             }
-            for p in parameters
+            for p in self._parameters_combinations()
         ]
 
 
+# MAJOR.MINOR.PATCH without leading zeros, a strict subset of what semver accepts
+_SIMPLE_VERSION_RE = re.compile(
+    r"(?:0|[1-9][0-9]*)\.(?:0|[1-9][0-9]*)\.(?:0|[1-9][0-9]*)"
+)
+
+
+@functools.lru_cache(maxsize=1024)
 def _is_valid_version(version: str) -> bool:
     """Test if version is using a valid semver format.
 
+    Only valid versions are cached, since an invalid version raises.
+
     :param version: version to validate
     :type version: str
     :raises: ValueError
     :return: true if version has a valid format
     :rtype: bool
     """
+    # fast path for the common MAJOR.MINOR.PATCH form, anything else is validated by semver
+    if isinstance(version, str) and _SIMPLE_VERSION_RE.fullmatch(version):
+        return True
+
+    # imported lazily, semver is only needed for versions with a pre-release or build part
+    from semver import VersionInfo
+
     VersionInfo.parse(version)
     return True
 
@@ -326,7 +378,8 @@ def _is_valid_start_time(start_time: Optional[datetime]) -> bool:
     if not isinstance(start_time, datetime):
         raise TypeError("start_time must be a valid datetime object")
 
-    if start_time.tzinfo != timezone.utc:
+    # identity check first, timezone.utc is a singleton and is what _parse_datetime returns
+    if start_time.tzinfo is not timezone.utc and start_time.tzinfo != timezone.utc:
         raise ValueError("start_time timezone must be UTC")
 
     return True
@@ -338,21 +391,39 @@ def _is_valid_trigger(trigger: PipelineTrigger) -> bool:
     return True
 
 
-# sine we support python3.6 we cannot use datetime fromisoformat and isoformat methods
-# instead we use this
+# the serialized format of the timestamps, the offset is written as +0000 which
+# isoformat does not produce and fromisoformat only supports from python 3.11
 _time_format = "%Y-%m-%dT%H:%M:%S%z"
+_utc_suffix = "+0000"
+_utc_offset = timedelta(0)
 
 
 def _format_datetime(t: datetime) -> str:
+    if t.utcoffset() == _utc_offset:
+        # fast path, isoformat is implemented in C, only the offset needs to be written by hand
+        return t.replace(tzinfo=None).isoformat(timespec="seconds") + _utc_suffix
     return t.strftime(_time_format)
 
 
 def _parse_datetime(tstr: str) -> datetime:
-
-    # ensure we always have the UTC timezone information
-    if not tstr.endswith("+0000"):
-        tstr += "+0000"
-    return datetime.strptime(tstr, _time_format)
+    # timestamps are always expressed in UTC, the offset is optional
+    if tstr.endswith(_utc_suffix):
+        tstr = tstr[: -len(_utc_suffix)]
+    elif tstr.endswith("+00:00"):
+        tstr = tstr[:-6]
+    elif tstr.endswith("Z"):
+        tstr = tstr[:-1]
+    if len(tstr) == 19 and tstr[10] == "T":
+        # fast path, fromisoformat is implemented in C but accepts more than the serialized format
+        # (dates only, fractional seconds, ...), the round trip through isoformat rejects those
+        try:
+            t = datetime.fromisoformat(tstr)
+        except ValueError:
+            pass
+        else:
+            if t.isoformat() == tstr:
+                return t.replace(tzinfo=timezone.utc)
+    return datetime.strptime(tstr + _utc_suffix, _time_format)
 
 
 def format_target_pipeline(p: Pipeline) -> str:
@@ -364,9 +435,9 @@ def parse_target_pipeline(target: str) -> Tuple:
     """Parse a pipeline name generated from format_target_pipeline and return both name and version."""
     if not target:
         raise ValueError(f"pipeline target name is not valid: {target}")
-    ss = target.split("_")
+    # split on the last underscore only, to support names containing underscores already
+    ss = target.rsplit("_", 1)
     if len(ss) < 2:
         raise ValueError(f"pipeline target name is not valid: {target}")
-    name = "_".join(ss[: len(ss) - 1])  # support for name containing underscore already
-    version = ss[-1]
+    name, version = ss
     return (name, version)
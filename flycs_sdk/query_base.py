@@ -7,6 +7,15 @@ from typing import Optional
 class QueryBase(ABC):
     """Base class for any query based object."""
 
+    __slots__ = (
+        "name",
+        "query",
+        "version",
+        "encrypt",
+        "static",
+        "destination_data_mart",
+    )
+
     def __init__(
         self,
         name: str,
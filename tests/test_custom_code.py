@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 from flycs_sdk.custom_code import CustomCode, Dependency, WrongSignatureError
@@ -19,6 +22,34 @@ class TestCustomCode:
                 "mycode", "1.0.0", build, requirements=["not a valid requirements"]
             )
 
+    def test_defaults(self):
+        def build(dag, env=None):
+            from airflow.operators.dummy_operator import DummyOperator
+
+            return DummyOperator(dag=dag)
+
+        cc = CustomCode("mycode", "1.0.0", build)
+        assert cc.dependencies == []
+        assert cc.requirements == []
+
+        cc.dependencies.append(Dependency("entity", "stage", "name"))
+        assert CustomCode("mycode", "1.0.0", build).dependencies == []
+
+    def test_requirements_formats(self):
+        def build(dag, env=None):
+            from airflow.operators.dummy_operator import DummyOperator
+
+            return DummyOperator(dag=dag)
+
+        requirements = [
+            "airflow==1.10.0",
+            "apache-airflow[gcp] >= 1.10, <2",
+            "pandas; python_version >= '3.8'",
+            "-e git+https://github.com/devoteamgcloud/flycs_sdk.git#egg=flycs_sdk",
+        ]
+        cc = CustomCode("mycode", "1.0.0", build, requirements=requirements)
+        assert cc.requirements == requirements
+
     def test_validation_signature_builder(self):
         def build():
             from airflow.operators.dummy_operator import DummyOperator
@@ -35,6 +66,35 @@ class TestCustomCode:
 
         cc = CustomCode("mycode", "1.0.0", build)
 
+    def test_validation_signature_method_builder(self):
+        class Builder:
+            def build(self, dag, env=None):
+                from airflow.operators.dummy_operator import DummyOperator
+
+                return DummyOperator(dag=dag)
+
+        cc = CustomCode("mycode", "1.0.0", Builder().build)
+
+        def build(dag, env=None, *, extra=None):
+            from airflow.operators.dummy_operator import DummyOperator
+
+            return DummyOperator(dag=dag)
+
+        with pytest.raises(WrongSignatureError):
+            CustomCode("mycode", "1.0.0", build)
+
+    def test_validation_signature_unhashable_builder(self):
+        class Builder:
+            def __eq__(self, other):
+                return isinstance(other, Builder)
+
+            def __call__(self, dag, env=None):
+                from airflow.operators.dummy_operator import DummyOperator
+
+                return DummyOperator(dag=dag)
+
+        cc = CustomCode("mycode", "1.0.0", Builder())
+
 
 class TestDependency:
     @pytest.fixture
@@ -51,3 +111,32 @@ class TestDependency:
     def test_from_dict(self, dependency):
         loaded = Dependency.from_dict(dependency.to_dict())
         assert loaded == dependency
+
+    def test_immutable(self, dependency):
+        with pytest.raises(AttributeError):
+            dependency.name = "other"
+
+        assert len({dependency, Dependency("entity", "stage", "name")}) == 1
+
+    def test_copy_pickle(self, dependency):
+        for loaded in (
+            copy.copy(dependency),
+            copy.deepcopy(dependency),
+            pickle.loads(pickle.dumps(dependency)),
+        ):
+            assert loaded == dependency
+            assert hash(loaded) == hash(dependency)
+            assert loaded.key == dependency.key
+
+    def test_compare_other_type(self, dependency):
+        assert dependency != ("entity", "stage", "name")
+        assert dependency != None  # noqa: E711
+
+    def test_key(self, dependency):
+        assert dependency.key == ("entity", "stage", "name")
+        entity, stage, name = dependency
+        assert (entity, stage, name) == dependency.key
+
+    def test_to_tuple(self, dependency):
+        assert dependency.to_tuple() == ("entity", "stage", "name")
+        assert Dependency.from_tuple(dependency.to_tuple()) == dependency
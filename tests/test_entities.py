@@ -56,6 +56,9 @@ class TestEntity:
         assert my_entity.version == entity_version
         assert my_entity.kind == entity_kind
 
+    def test_stages(self, my_entity):
+        assert my_entity.stages == list(my_entity.stage_config.keys())
+
     def test_add_transformation(self):
         entity = Entity(entity_name, entity_version)
         transformation = Transformation("my_query", "SELECT * FROM TABLE", "1.0.0")
@@ -67,7 +70,10 @@ class TestEntity:
             "staging": {transformation.name: transformation}
         }
 
-        with pytest.raises(ConflictingNameError):
+        with pytest.raises(
+            ConflictingNameError,
+            match="an object with name my_query already exists in stage staging",
+        ):
             entity.add_transformation("staging", transformation)
 
     def test_add_view(self):
@@ -151,6 +157,33 @@ class TestEntity:
         loaded = Entity.from_dict(d)
         assert loaded == my_entity
 
+        my_entity.stage_config["staging"]["table_5"] = "1.0.0"
+        loaded = Entity.from_dict(my_entity.to_dict())
+        assert loaded.stage_config["staging"]["table_5"] == "1.0.0"
+        assert loaded == my_entity
+
+    def test_compare_other_type(self, my_entity):
+        assert my_entity != entity_name
+        assert my_entity != None  # noqa: E711
+
+    def test_from_dict_invalid_kind(self, my_dict):
+        my_dict["kind"] = "not_a_kind"
+        with pytest.raises(ValueError):
+            Entity.from_dict(my_dict)
+
+        my_dict["kind"] = ["vanilla"]
+        with pytest.raises(ValueError):
+            Entity.from_dict(my_dict)
+
+    def test_hash(self, my_entity):
+        assert hash(my_entity) == hash((entity_name, entity_version))
+        assert len({my_entity, my_entity}) == 1
+
+    def test_to_dict_flat(self, my_entity):
+        d = my_entity.to_dict(flat=True)
+        assert d["stage_config"] == my_entity.stage_config
+        assert type(my_entity).from_dict(d) == my_entity
+
 
 class TestBaseLayerEntity(TestEntity):
     @pytest.fixture
@@ -235,6 +268,22 @@ class TestBaseLayerEntity(TestEntity):
             ignore_order=True,
         )
 
+    def test_assign_versions(self, empty_entity):
+        assert empty_entity.staging_versions == {}
+
+        empty_entity.staging_versions = {"table_1": "2.0.0"}
+        assert empty_entity.stage_config["staging"] == {"table_1": "2.0.0"}
+        assert {"name": "staging", "versions": {"table_1": "2.0.0"}} in (
+            empty_entity.to_dict()["stage_config"]
+        )
+
+        empty_entity.staging_versions = None
+        assert empty_entity.get_stage_versions("staging") == {}
+
+    def test_get_stage_config(self, my_entity):
+        assert my_entity.get_stage_config() is my_entity.stage_config
+        assert list(my_entity.get_stage_config()) == my_entity.stages
+
     def test_to_dict_empty(self, empty_entity):
         assert not DeepDiff(
             empty_entity.to_dict(),
@@ -308,6 +357,41 @@ class TestParametrizedBaseLayerEntity(TestParametrizedEntity, TestBaseLayerEntit
             data_mart_versions={"table_9": "1.0.0", "table_10": "1.0.0"},
         )
 
+    def test_from_dict_parametrized(self, my_dict, my_entity):
+        e = ParametrizedBaseLayerEntity.from_dict(my_dict)
+        assert isinstance(e, ParametrizedBaseLayerEntity)
+        assert e == my_entity
+        assert e.data_mart_versions == {"table_9": "1.0.0", "table_10": "1.0.0"}
+
+    def test_serialize_deserialize_parametrized(self, my_entity):
+        loaded = ParametrizedBaseLayerEntity.from_dict(my_entity.to_dict())
+        assert loaded == my_entity
+
+    def test_to_dict_uses_get_stage_versions(self):
+        class LanguageEntity(ParametrizedBaseLayerEntity):
+            def get_stage_versions(self, stage, parameters=None):
+                if stage == "staging" and parameters:
+                    return {f"table_{parameters['language']}": "1.0.0"}
+                return super().get_stage_versions(stage, parameters)
+
+        entity = LanguageEntity(entity_name, entity_version, entity_kind)
+        stage_config = entity.to_dict({"language": "fr"}, flat=True)["stage_config"]
+        assert stage_config["staging"] == {"table_fr": "1.0.0"}
+        assert stage_config["datalake"] == {}
+
+
+class TestParametrizedEntityToDict:
+    def test_to_dict_per_parameters(self):
+        entity = ParametrizedEntity(
+            entity_name, entity_version, stage_config={"raw": {"table_1": "1.0.0"}}
+        )
+        assert entity.to_dict({"language": "fr"})["name"] == "test_fr"
+        assert entity.to_dict({"language": "nl"})["name"] == "test_nl"
+        assert entity.to_dict()["name"] == "test"
+
+        entity.name = "other"
+        assert entity.to_dict({"language": "fr"})["name"] == "other_fr"
+
 
 class TestParametrizedEntityName:
     def test_parametrized_entity_name(self):
@@ -316,6 +400,14 @@ class TestParametrizedEntityName:
             == "name_fr_be"
         )
 
+    def test_parametrized_entity_name_too_long(self):
+        with pytest.raises(ValueError):
+            _parametrized_name("name", {"language": "x" * 1024})
+
+    def test_parametrized_entity_name_max_length(self):
+        name = _parametrized_name("name", {"language": "x" * 1016, "country": "be"})
+        assert len(name) == 1024
+
 
 class TestNoKindEntity:
     @pytest.fixture
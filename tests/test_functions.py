@@ -2,6 +2,7 @@
 from typing import List
 
 import pytest
+from flycs_sdk.custom_code import Dependency
 from flycs_sdk.functions import Function, Argument
 
 function_name = "my_function"
@@ -35,6 +36,14 @@ class TestArgument:
         argument2 = my_argument.from_dict(d)
         assert my_argument == argument2
 
+    def test_hash(self, my_argument):
+        other = Argument(name=argument_name, type=argument_type)
+        assert len({my_argument, other}) == 1
+
+    def test_compare(self, my_argument):
+        assert my_argument != Argument(name=argument_name, type=other_argument_type)
+        assert my_argument != argument_name
+
 
 class TestFunction:
     @pytest.fixture
@@ -88,3 +97,32 @@ class TestFunction:
         d = my_function.to_dict()
         function2 = my_function.from_dict(d)
         assert my_function == function2
+
+        my_function.dependencies.append(Dependency("entity", "stage", "name"))
+        d = my_function.to_dict()
+        assert d["DEPENDS_ON"] == [
+            {"ENTITY": "entity", "STAGE": "stage", "NAME": "name"}
+        ]
+        assert my_function.from_dict(d) == my_function
+
+    def test_no_instance_dict(self, my_function):
+        assert not hasattr(my_function, "__dict__")
+        assert not hasattr(my_function.argument_list[0], "__dict__")
+
+    def test_compare(self, my_function):
+        other = Function.from_dict(my_function.to_dict())
+        assert my_function == other
+        other.language = "js"
+        assert my_function != other
+        assert my_function != function_name
+
+    def test_arguments_to_tuples(self, my_function):
+        assert my_function.arguments_to_tuples() == [
+            (argument_name, argument_type),
+            (other_argument_name, other_argument_type),
+        ]
+
+    def test_hash(self, my_function):
+        other = Function.from_dict(my_function.to_dict())
+        assert hash(other) == hash(my_function)
+        assert len({my_function, other}) == 1
@@ -12,6 +12,10 @@ from flycs_sdk.pipelines import (
     ParametrizedPipeline,
     _parse_datetime,
     _format_datetime,
+    _is_valid_version,
+    _is_valid_start_time,
+    format_target_pipeline,
+    parse_target_pipeline,
     PipelineKind,
 )
 
@@ -94,6 +98,38 @@ class TestPipeline:
         assert my_pipeline_pubsub.entities == []
         assert my_pipeline_pubsub.trigger.topic == pipeline_pubsub_topic
 
+    def test_invalid_version(self):
+        with pytest.raises(ValueError):
+            Pipeline(
+                name=pipeline_name,
+                version="not_a_version",
+                schedule=pipeline_schedule,
+                kind=pipeline_kind,
+                start_time=pipeline_start_time,
+                entities=[],
+            )
+
+    @pytest.mark.parametrize(
+        "version", ["0.0.1", "1.2.3", "10.20.30", "1.0.0-rc.1", "1.0.0+build.5"]
+    )
+    def test_valid_version(self, version):
+        assert _is_valid_version(version)
+
+    @pytest.mark.parametrize("version", ["1.0", "01.0.0", "1.0.0.0", "v1.0.0"])
+    def test_invalid_version_format(self, version):
+        with pytest.raises(ValueError):
+            _is_valid_version(version)
+
+    def test_parse_target_pipeline(self, my_pipeline):
+        target = format_target_pipeline(my_pipeline)
+        assert parse_target_pipeline(target) == (pipeline_name, pipeline_version)
+        assert parse_target_pipeline("my_long_name_1.0.0") == ("my_long_name", "1.0.0")
+
+    @pytest.mark.parametrize("target", ["", "no-underscore"])
+    def test_parse_target_pipeline_invalid(self, target):
+        with pytest.raises(ValueError):
+            parse_target_pipeline(target)
+
     def test_invalid_start_time(self):
         with pytest.raises(TypeError):
             Pipeline(
@@ -116,6 +152,25 @@ class TestPipeline:
                 entities=[],
             )
 
+    def test_no_instance_dict(self, my_pipeline):
+        assert not hasattr(my_pipeline, "__dict__")
+
+    def test_valid_start_time_utc_offset(self):
+        assert _is_valid_start_time(pipeline_start_time)
+        assert _is_valid_start_time(
+            pipeline_start_time.astimezone(timezone(timedelta(0), "UTC"))
+        )
+        with pytest.raises(ValueError):
+            _is_valid_start_time(pipeline_start_time.replace(tzinfo=None))
+
+        # the offset of a zone with daylight saving time is only zero part of the year
+        zoneinfo = pytest.importorskip("zoneinfo")
+        london = zoneinfo.ZoneInfo("Europe/London")
+        with pytest.raises(ValueError):
+            _is_valid_start_time(datetime(2020, 12, 2, 15, 38, 34, tzinfo=london))
+        with pytest.raises(ValueError):
+            _is_valid_start_time(datetime(2020, 7, 2, 15, 38, 34, tzinfo=london))
+
     def test_add_entity(self, my_pipeline, my_entity):
         assert my_pipeline.entities == []
         my_pipeline.add_entity(my_entity)
@@ -206,6 +261,22 @@ class TestPipeline:
                 if isinstance(my_pipeline, ParametrizedPipeline):
                     assert loaded.params  # ensure the params area loaded
 
+    def test_compare(self, my_entity):
+        def make(kind):
+            return Pipeline(
+                name=pipeline_name,
+                version=pipeline_version,
+                schedule=pipeline_schedule,
+                kind=kind,
+                start_time=pipeline_start_time,
+                entities=[my_entity],
+            )
+
+        assert make(PipelineKind.VANILLA) == make(PipelineKind.VANILLA)
+        assert make(PipelineKind.VANILLA) != make(PipelineKind.DATA_VAULT)
+        assert make(PipelineKind.VANILLA) != pipeline_name
+        assert len({make(PipelineKind.VANILLA), make(PipelineKind.VANILLA)}) == 1
+
     def test_serialize_deserialize_pubsub(self, my_pipeline_pubsub, my_entity):
         my_pipeline_pubsub.add_entity(my_entity)
         serialized = my_pipeline_pubsub.to_dict()
@@ -221,6 +292,45 @@ class TestPipeline:
         parsed = _parse_datetime(tstr)
         assert parsed == pipeline_start_time
 
+    def test_format_datetime(self):
+        assert _format_datetime(pipeline_start_time) == "2020-12-02T15:38:34+0000"
+        assert (
+            _format_datetime(pipeline_start_time.replace(microsecond=123))
+            == "2020-12-02T15:38:34+0000"
+        )
+        naive = pipeline_start_time.replace(tzinfo=None)
+        assert _format_datetime(naive) == "2020-12-02T15:38:34"
+
+    def test_parse_datetime_without_offset(self):
+        parsed = _parse_datetime("2020-12-02T15:38:34")
+        assert parsed == pipeline_start_time
+        assert parsed.tzinfo == timezone.utc
+
+    @pytest.mark.parametrize(
+        "tstr", ["2020-12-02T15:38:34+00:00", "2020-12-02T15:38:34Z"]
+    )
+    def test_parse_datetime_utc_variants(self, tstr):
+        parsed = _parse_datetime(tstr)
+        assert parsed == pipeline_start_time
+        assert parsed.tzinfo == timezone.utc
+
+    def test_parse_datetime_invalid(self):
+        with pytest.raises(ValueError):
+            _parse_datetime("2020-12-02T15:38:34+01:00")
+
+    @pytest.mark.parametrize(
+        "tstr",
+        [
+            "2020-12-02",
+            "2020-12-02T15",
+            "2020-12-02 15:38:34",
+            "2020-12-02T15:38:34.123",
+        ],
+    )
+    def test_parse_datetime_incomplete(self, tstr):
+        with pytest.raises(ValueError):
+            _parse_datetime(tstr)
+
 
 pipeline_parameters = {"language": ["nl", "fr"], "country": ["be", "en"]}
 
@@ -393,3 +503,27 @@ class TestParametrizedPipeline(TestPipeline):
         assert sorted(
             ["test_nl_be", "test_nl_en", "test_fr_be", "test_fr_en"]
         ) == sorted(pipeline_names)
+
+    def test_unrolled_pipelines(self, my_pipeline, my_entity):
+        my_pipeline.add_entity(my_entity)
+        pipelines = my_pipeline.unrolled_pipelines()
+        assert [p.name for p in pipelines] == [
+            "test_nl_be",
+            "test_nl_en",
+            "test_fr_be",
+            "test_fr_en",
+        ]
+        assert pipelines[1].params == {"language": "nl", "country": "en"}
+        assert all(p.entities == [my_entity] for p in pipelines)
+
+    def test_parameters_combinations(self, my_pipeline):
+        assert len(list(my_pipeline._parameters_combinations())) == 4
+
+        # the dictionaries handed out are not shared between callers
+        my_pipeline.unrolled_pipelines()[0].params["extra"] = "x"
+        assert my_pipeline.to_dict()[0]["params"] == {"language": "nl", "country": "be"}
+
+        my_pipeline.parameters = {"language": ["nl"], "country": ["be"]}
+        assert list(my_pipeline._parameters_combinations()) == [
+            {"language": "nl", "country": "be"}
+        ]